@@ -9,23 +9,60 @@
 '''
 
 import re
-import requests
-import json
-import math
-import fire
 import os
-import glob
-from datetime import datetime, timedelta
-from pathlib import Path
-from labbot_manager_base import LabbotManagerClientBase
+import numpy as np
+from labbot_manager_base import LabbotManagerClientBase, _ARM_ARITY, _AXIS_INDEX, _DEG2RAD, _configure_logging, _dig
+
+# 关节名称到(部位, 关节索引)的映射
+_JOINT_MAPPING = {
+    'b1': ('body', 0), 'b2': ('body', 1),
+    'l1': ('left', 0), 'l2': ('left', 1), 'l3': ('left', 2), 'l4': ('left', 3),
+    'l5': ('left', 4), 'l6': ('left', 5), 'l7': ('left', 6),
+    'r1': ('right', 0), 'r2': ('right', 1), 'r3': ('right', 2), 'r4': ('right', 3),
+    'r5': ('right', 4), 'r6': ('right', 5), 'r7': ('right', 6)
+}
+# 末端偏移命令中的单个分量，如 "x+0.05"
+_OFFSET_RE = re.compile(r'\s*([xyzXYZ])\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(?:,|$)')
+# 手臂名称到状态响应中数据字段的映射
+_ARM_DATA_KEY = {'left': 'left_arm', 'right': 'right_arm'}
+
+
+def _parse_offset_commands(offset_commands):
+    """解析末端偏移命令，如 "x+0.05,y-0.02"
+
+    Returns:
+        list: [(轴索引, 偏移量), ...]，格式错误返回None
+    """
+    offsets = []
+    pos = 0
+    for match in _OFFSET_RE.finditer(offset_commands):
+        if match.start() != pos:
+            return None
+        offsets.append((_AXIS_INDEX[match.group(1)], float(match.group(2))))
+        pos = match.end()
+    if not offsets or pos != len(offset_commands):
+        return None
+    return offsets
+
 
 class LabbotManagerClient(LabbotManagerClientBase):
     """精简版机器人管理客户端，基于基类添加更多功能"""
     
-    def __init__(self):
-        super().__init__()
-    
-    def fast_move_j(self, cmds, speed=0.3, acc=0.3, execute=True, wait=True):
+    def _post_api(self, endpoint, payload, timeout=30):
+        """发送请求并解析响应
+
+        Returns:
+            dict: 请求成功且响应code为200时返回解析后的响应，否则返回None
+        """
+        result = self._send_request(endpoint, payload, timeout=timeout)
+        if result is None:
+            return None
+        if result.get('code') != 200:
+            print(f"⚠️ {endpoint} 执行失败: {result.get('msg', '未知错误')}")
+            return None
+        return result
+
+    def fast_move_j(self, cmds, speed=0.3, acc=0.3, execute=True, wait=True, need_traj=False):
         """快速控制多个关节的角度变化（增量模式）
         
         Args:
@@ -34,49 +71,42 @@ class LabbotManagerClient(LabbotManagerClientBase):
             acc: 运动加速度 (0.0-1.0)
             execute: 是否执行运动
             wait: 是否等待执行完成
+            need_traj: 是否需要服务端返回轨迹数据（本方法只返回成功与否，默认不需要）
         
         Returns:
             bool: 成功返回True，失败返回False
         """
-        joint_mapping = {
-            'b1': ('body', 0), 'b2': ('body', 1),
-            'l1': ('left', 0), 'l2': ('left', 1), 'l3': ('left', 2), 'l4': ('left', 3),
-            'l5': ('left', 4), 'l6': ('left', 5), 'l7': ('left', 6),
-            'r1': ('right', 0), 'r2': ('right', 1), 'r3': ('right', 2), 'r4': ('right', 3),
-            'r5': ('right', 4), 'r6': ('right', 5), 'r7': ('right', 6)
-        }
-        
         try:
             arm_increments = {}
             for cmd_pair in cmds.split(','):
                 joint_name, cmd = cmd_pair.strip().split(':', 1)
                 increment_degrees = float(cmd.strip())
                 
-                arm_name, joint_index = joint_mapping[joint_name.strip()]
-                increment_radians = math.radians(increment_degrees)
+                arm_name, joint_index = _JOINT_MAPPING[joint_name.strip()]
+                increment_radians = increment_degrees * _DEG2RAD
                 
-                if arm_name not in arm_increments:
-                    arm_increments[arm_name] = [0.0, 0.0] if arm_name == 'body' else [0.0] * 7
-                arm_increments[arm_name][joint_index] = increment_radians
+                increments = arm_increments.get(arm_name)
+                if increments is None:
+                    increments = arm_increments[arm_name] = np.zeros(_ARM_ARITY[arm_name])
+                increments[joint_index] = increment_radians
             
             arm_requests = []
             for arm_name, increments in arm_increments.items():
                 arm_requests.append({"arm_name": arm_name, "increment_joint_positions": increments})
             
-            response = requests.post(
-                f"{self.server_url}/move_j",
-                json={
+            result = self._post_api(
+                "move_j",
+                {
                     "arm_requests": arm_requests,
                     "speed": speed,
                     "acc": acc,
-                    "need_traj": True,
+                    "need_traj": bool(need_traj),
                     "wait": wait,
                     "execute": execute
                 },
-                headers={"Content-Type": "application/json"},
                 timeout=60
             )
-            return response.status_code == 200
+            return result is not None
         except Exception:
             return False
 
@@ -92,54 +122,35 @@ class LabbotManagerClient(LabbotManagerClientBase):
             wait: 是否等待执行完成
         
         Returns:
-            bool: 成功返回True，失败返回False
+            dict: move_j_to的响应结果（包含traj_id等），失败返回None
         """
+        arm_key = _ARM_DATA_KEY.get(arm_name)
+        offsets = _parse_offset_commands(offset_commands)
+        if arm_key is None or offsets is None:
+            return None
+
         try:
             # 获取当前状态
-            response = requests.post(
-                f"{self.server_url}/get_robot_status",
-                json={"arm": arm_name},
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                return False
-            
-            result = response.json()
-            if result.get('code') != 200:
-                return False
+            result = self._post_api("get_robot_status", {"arm": arm_name}, timeout=30)
+            if result is None:
+                return None
             
             # 获取末端执行器位姿
-            arm_data = result.get('left_arm' if arm_name == 'left' else 'right_arm', {})
-            robot_tf = arm_data.get('robot_tf', {})
-            tcp_robot = robot_tf.get('tcp', {})
+            tcp_robot = _dig(result, arm_key, 'robot_tf', 'tcp', default={})
             current_position = tcp_robot.get('position', [])
             current_quaternion = tcp_robot.get('orientation', [])
             
             if len(current_position) != 3 or len(current_quaternion) != 4:
-                return False
+                return None
             
-            # 解析偏移命令
-            target_position = current_position.copy()
-            for offset_part in offset_commands.split(','):
-                offset_part = offset_part.strip()
-                if len(offset_part) < 2:
-                    continue
-                
-                axis = offset_part[0].lower()
-                value_str = offset_part[1:]
-                
-                if axis in ['x', 'y', 'z']:
-                    try:
-                        offset_value = float(value_str)
-                        axis_index = {'x': 0, 'y': 1, 'z': 2}[axis]
-                        target_position[axis_index] += offset_value
-                    except ValueError:
-                        continue
+            # 叠加偏移量
+            deltas = np.zeros(3)
+            for axis_index, offset_value in offsets:
+                deltas[axis_index] += offset_value
+            target_position = np.asarray(current_position, dtype=np.float64) + deltas
             
             # 调用基类的move_j_to方法
-            position_str = f"{target_position[0]},{target_position[1]},{target_position[2]}"
+            position_str = f"{target_position[0]:.6f},{target_position[1]:.6f},{target_position[2]:.6f}"
             quaternion_str = f"{current_quaternion[0]},{current_quaternion[1]},{current_quaternion[2]},{current_quaternion[3]}"
             
             result = self.move_j_to(
@@ -160,9 +171,9 @@ class LabbotManagerClient(LabbotManagerClientBase):
                 tolerance=None
             )
             
-            return result and result.get('code') == 200
+            return result or None
         except Exception:
-            return False
+            return None
 
     def force_comp(self, arm_name, position, orientation=[0,0,0], ref_frame="tcp", vel=0.02,
                    zero_ft_sensor_first=True, stiff_scale=[1.0,1.0,1.0,1.0,1.0,1.0], speed=0.02, acc=0.02,
@@ -187,16 +198,18 @@ class LabbotManagerClient(LabbotManagerClientBase):
         Returns:
             bool: 成功返回True，失败返回False
         """
+        # 解析位置、姿态和刚度缩放
+        position = self._parse_vector(position, 3, "位置")
+        if position is None:
+            return False
+        orientation = self._parse_vector(orientation, 3, "姿态")
+        if orientation is None:
+            return False
+        stiff_scale = self._parse_vector(stiff_scale, 6, "刚度缩放")
+        if stiff_scale is None:
+            return False
+
         try:
-            # 解析位置和姿态
-            if isinstance(position, str):
-                position_parts = position.split(',')
-                position = [float(x.strip()) for x in position_parts if x.strip()]
-            
-            if isinstance(orientation, str):
-                orientation_parts = orientation.split(',')
-                orientation = [float(x.strip()) for x in orientation_parts if x.strip()]
-            
             # 构造请求
             force_comp_request = {
                 "arm_name": arm_name,
@@ -214,21 +227,21 @@ class LabbotManagerClient(LabbotManagerClientBase):
                 "must_reach_target": bool(must_reach_target)
             }
             
-            response = requests.post(
-                f"{self.server_url}/force_comp",
-                json=force_comp_request,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            
-            return response.status_code == 200
+            return self._post_api("force_comp", force_comp_request, timeout=30) is not None
         except Exception:
             return False
 
 def main():
     """主函数，使用Fire创建命令行接口"""
+    import fire
+
     os.environ['PAGER'] = 'cat'
-    fire.Fire(LabbotManagerClient)
+    _configure_logging()
+    client = LabbotManagerClient()
+    try:
+        fire.Fire(client)
+    finally:
+        client.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,44 +1,198 @@
 #!/usr/bin/env python3
 
 import traceback
+import logging
+import socket
 import requests
 import json
 import math
-import fire
 import os
-import traceback
+import threading
+import numpy as np
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # 服务器地址
 SERVER_URL = "http://localhost:9999/api/robot/action"
 
+# 各部位的关节数量
+_ARM_ARITY = {"body": 2, "left": 7, "right": 7}
+
+# 角度转弧度系数
+_DEG2RAD = math.pi / 180.0
+
+# 合法的手臂名称
+_VALID_ARMS = frozenset({"left", "right"})
+_VALID_ARMS_ALL = frozenset({"left", "right", "all"})
+# 合法的参考坐标系
+_VALID_REF_FRAMES = frozenset({"tcp", "world"})
+
+# 偏移命令中坐标轴字符到位置索引的映射（大小写均可）
+_AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2, 'X': 0, 'Y': 1, 'Z': 2}
+
+def _dig(data, *keys, default=None):
+    """按键路径逐层取嵌套字典中的值，任一层缺失时返回default"""
+    for key in keys:
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+@lru_cache(maxsize=64)
+def _parse_input_params(raw):
+    """解析原语输入参数的JSON字符串，相同字符串只解析一次
+
+    返回的字典由缓存共享，调用方只能读取（如直接序列化），不得修改
+    """
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+
+
+def _json_default(obj):
+    """json回退路径下序列化numpy数组和标量"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj):
+    """序列化请求体，优先使用orjson，支持numpy数组"""
+    if orjson is not None:
+        # 非C连续的数组（如切片视图）orjson无法直接序列化，会交给default处理
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def _loads(data):
+    """解析响应体，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _close_future_response(future):
+    """关闭对冲请求中未被采用的响应"""
+    response = future.result()
+    if response is not None:
+        response.close()
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """在urllib3默认套接字选项（已包含TCP_NODELAY）基础上开启SO_KEEPALIVE"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        return super().init_poolmanager(*args, **kwargs)
+
 class LabbotManagerClientBase:
     """MoveJ客户端命令行工具"""
     
     def __init__(self):
         self.server_url = SERVER_URL
+        # 远程主机名到服务器地址的缓存
+        self._remote_url_cache = {}
+        # 是否输出参数回显等提示信息，作为库调用时可设置 LABBOT_VERBOSE=0 关闭
+        self.verbose = os.environ.get("LABBOT_VERBOSE", "1") == "1"
+        # 复用同一个Session，保持keep-alive连接，避免每次请求重新建立TCP连接
+        self._session = self._new_session()
+        # 对冲请求使用的线程池，首次使用时创建
+        self._hedge_executor = None
+        # Session不保证线程安全，对冲请求的每个工作线程使用各自的Session
+        self._hedge_local = threading.local()
+        self._hedge_sessions = []
+        self._hedge_lock = threading.Lock()
+
+    @staticmethod
+    def _new_session():
+        """创建带keep-alive连接池的Session"""
+        session = requests.Session()
+        # 所有接口都是POST，不在urllib3重试的allowed_methods中，因此这里只会重试连接错误，
+        # 不会因读超时或5xx状态码重发（避免重复下发运动指令）
+        adapter = _KeepAliveAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        return session
+
+    def close(self):
+        """关闭HTTP连接池"""
+        if self._hedge_executor is not None:
+            # 等待仍在进行中的对冲请求结束，再关闭它们使用的Session
+            self._hedge_executor.shutdown(wait=True)
+            self._hedge_executor = None
+        with self._hedge_lock:
+            for session in self._hedge_sessions:
+                session.close()
+            self._hedge_sessions.clear()
+        self._session.close()
+
+    def __del__(self):
+        # 初始化未完成时没有可释放的资源
+        if getattr(self, "_session", None) is not None:
+            self.close()
+
+    @property
+    def server_url(self):
+        return self._server_url
+
+    @server_url.setter
+    def server_url(self, value):
+        self._server_url = value
+        # 服务器地址变化后，之前拼接好的接口URL全部作废
+        self._endpoint_urls = {}
+
+    def _endpoint_url(self, endpoint):
+        """返回接口的完整URL，同一服务器地址下只拼接一次"""
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls[endpoint] = f"{self._server_url}/{endpoint}"
+        return url
 
     def get_remote_server_url(self, host: str):
-        return f"http://{host}:9999/api/robot/action"
+        url = self._remote_url_cache.get(host)
+        if url is None:
+            url = self._remote_url_cache[host] = f"http://{host}:9999/api/robot/action"
+        return url
     
     def _degrees_to_radians(self, positions):
         """将角度转换为弧度"""
-        return [math.radians(pos) for pos in positions]
+        return np.deg2rad(np.asarray(positions, dtype=np.float64))
     
     def _parse_positions(self, positions_input):
-        """解析位置参数为浮点数列表"""
+        """解析位置参数为float64数组"""
         try:
             # 处理 fire 传递的元组或字符串参数
-            if isinstance(positions_input, tuple):
-                positions = list(positions_input)
-            elif isinstance(positions_input, str):
-                positions = [float(x.strip()) for x in positions_input.split(',')]
-            elif isinstance(positions_input, list):
-                positions = positions_input
+            if isinstance(positions_input, str):
+                positions = np.array(positions_input.split(','), dtype=np.float64)
+            elif isinstance(positions_input, (tuple, list, np.ndarray)):
+                positions = np.ascontiguousarray(positions_input, dtype=np.float64)
             else:
                 raise ValueError(f"不支持的位置参数类型: {type(positions_input)}")
             
-            # 转换为浮点数
-            positions = [float(pos) for pos in positions]
+            if positions.ndim != 1:
+                raise ValueError(f"位置参数应为一维序列，但得到{positions.ndim}维")
             
             # if len(positions) != 7:
             #     raise ValueError(f"期望7个关节位置，但得到{len(positions)}个")
@@ -47,21 +201,123 @@ class LabbotManagerClientBase:
             print(f"Joints parameter parsing error: {traceback.format_exc()}")
             return None
     
+    def _parse_arm_positions(self, arm_name, positions_input, degree=False):
+        """解析并校验单个部位的关节位置，degree为True时转换为弧度"""
+        positions = self._parse_positions(positions_input)
+        if positions is None:
+            return None
+        if positions.size != _ARM_ARITY[arm_name]:
+            print(f"❌ {arm_name}关节位置应该有{_ARM_ARITY[arm_name]}个值，但得到{positions.size}个")
+            return None
+        return self._degrees_to_radians(positions) if degree else positions
+    
+    def _parse_vector(self, value, expected_len, label):
+        """解析固定长度的向量参数，失败时打印错误并返回None"""
+        vector = self._parse_positions(value)
+        if vector is None:
+            return None
+        if vector.size != expected_len:
+            print(f"❌ {label}参数应该有{expected_len}个值，但得到{vector.size}个")
+            return None
+        return vector
+    
+    def _echo(self, *args, **kwargs):
+        """输出提示信息，verbose关闭时跳过"""
+        if self.verbose:
+            print(*args, **kwargs)
+
+    def _dump_json(self, title, data):
+        """以DEBUG级别输出格式化后的JSON，未开启DEBUG时不做序列化"""
+        if logger.isEnabledFor(logging.DEBUG):
+            if orjson is not None:
+                text = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+            else:
+                text = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+            logger.debug("%s: %s", title, text)
+
+    def _parse_response(self, response):
+        """检查响应状态码并解析JSON，失败时返回None"""
+        if not response.ok:
+            print(f"\n❌ 请求失败，状态码: {response.status_code}")
+            print(f"错误信息: {response.text}")
+            return None
+        try:
+            result = _loads(response.content)
+        except ValueError:
+            print(f"\nRequest exception: {traceback.format_exc()}")
+            return None
+        self._echo("\n✅ 请求成功!")
+        return result
+
     def _send_request(self, endpoint, data, timeout=120):
         """发送HTTP POST请求并处理响应"""
         try:
-            response = requests.post(
-                f"{self.server_url}/{endpoint}",
-                json=data,
-                headers={"Content-Type": "application/json"},
+            response = self._session.post(
+                self._endpoint_url(endpoint),
+                data=_dumps(data),
                 timeout=timeout
             )
-            response.raise_for_status()  # 如果状态码不是200, 则引发HTTPError
-            print("\n✅ 请求成功!")
-            return response.json()
-        except requests.exceptions.RequestException:
+        except RequestException:
             print(f"\nRequest exception: {traceback.format_exc()}")
             return None
+        return self._parse_response(response)
+
+    def _hedge_post(self, url, body, timeout):
+        """对冲请求的工作线程：使用本线程的Session发送请求，返回原始响应，异常时返回None"""
+        session = getattr(self._hedge_local, "session", None)
+        if session is None:
+            session = self._hedge_local.session = self._new_session()
+            with self._hedge_lock:
+                self._hedge_sessions.append(session)
+        try:
+            return session.post(url, data=body, timeout=timeout)
+        except RequestException:
+            print(f"\nRequest exception: {traceback.format_exc()}")
+            return None
+
+    def _send_request_hedged(self, endpoint, data, timeout=120, hedge_delay=None):
+        """只读接口的对冲请求
+
+        首个请求在hedge_delay秒内未返回时再发送一次相同请求，取先成功返回的结果。
+        hedge_delay为None时等同于_send_request。仅用于无副作用的查询接口。
+        """
+        if not hedge_delay:
+            return self._send_request(endpoint, data, timeout=timeout)
+
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=4)
+        url = self._endpoint_url(endpoint)
+        body = _dumps(data)
+        futures = [self._hedge_executor.submit(self._hedge_post, url, body, timeout)]
+        done, pending = wait(futures, timeout=float(hedge_delay))
+        if not done:
+            futures.append(self._hedge_executor.submit(self._hedge_post, url, body, timeout))
+            pending.add(futures[-1])
+
+        # 取先返回且状态码正常的响应；都失败时取最后一个非空响应用于输出错误信息
+        winner = fallback = None
+        while winner is None and (done or pending):
+            for future in done:
+                response = future.result()
+                if response is None:
+                    continue
+                if response.ok:
+                    winner = future
+                    break
+                fallback = future
+            if winner is None and pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            else:
+                done = set()
+        winner = winner or fallback
+
+        # 关闭落选的响应，仍在进行中的请求在完成后关闭
+        for future in futures:
+            if future is not winner:
+                future.add_done_callback(_close_future_response)
+        if winner is None:
+            return None
+        return self._parse_response(winner.result())
 
     def move_j(self, body_positions, left_positions, right_positions, degree=False, speed=1.0, acc=1.0,
                    need_traj=True, wait=False, execute=True, use_arms=""):
@@ -79,22 +335,16 @@ class LabbotManagerClientBase:
             execute: 是否执行运动
             use_arms: 指定要使用的机械臂列表，如"left_arm,right_arm"或"left_arm"
         """
-        print(f"\n=== 绝对关节运动 ===\n")
+        self._echo(f"\n=== 绝对关节运动 ===\n")
         
-        # 解析位置参数
-        body_pos = self._parse_positions(body_positions)
-        left_pos = self._parse_positions(left_positions)
-        right_pos = self._parse_positions(right_positions)
+        # 解析位置参数，按需将角度转为弧度
+        body_pos = self._parse_arm_positions("body", body_positions, degree)
+        left_pos = self._parse_arm_positions("left", left_positions, degree)
+        right_pos = self._parse_arm_positions("right", right_positions, degree)
         
         if body_pos is None or left_pos is None or right_pos is None:
             return False
         
-        # 角度转弧度
-        if degree:
-            body_pos = self._degrees_to_radians(body_pos)
-            left_pos = self._degrees_to_radians(left_pos)
-            right_pos = self._degrees_to_radians(right_pos)
-        
         arm_requests = [
             {"arm_name": "body", "joint_positions": body_pos},
             {"arm_name": "left", "joint_positions": left_pos},
@@ -107,13 +357,16 @@ class LabbotManagerClientBase:
             "acc": acc,
             "need_traj": need_traj,
             "wait": wait,
-            "execute": execute,
-            "use_arms": use_arms.split(",")
+            "execute": execute
         }
+        if isinstance(use_arms, str):
+            use_arms = [arm.strip() for arm in use_arms.split(",") if arm.strip()]
+        if use_arms:
+            movej_request["use_arms"] = list(use_arms)
         
         return self._send_request("move_j", movej_request)
 
-    def find_apriltag(self, arm="left", marker_id=0, repeat_times=1, repeat_time_interval=0.1):
+    def find_apriltag(self, arm="left", marker_id=0, repeat_times=1, repeat_time_interval=0.1, hedge_delay=None):
         """查找AprilTag标记
         
         Args:
@@ -121,8 +374,9 @@ class LabbotManagerClientBase:
             marker_id: 要查找的AprilTag标记ID（默认0）
             repeat_times: 重复查找次数（默认4次）
             repeat_time_interval: 每次重复查找的时间间隔（秒）（默认0.1秒）
+            hedge_delay: 对冲请求延迟（秒），超时未返回时再发一次请求（默认None，不启用）
         """
-        print(f"\n=== 查找AprilTag标记 ===\n")
+        self._echo(f"\n=== 查找AprilTag标记 ===\n")
         
         # 构造请求参数
         apriltag_request = {
@@ -132,11 +386,11 @@ class LabbotManagerClientBase:
             "repeat_time_interval": float(repeat_time_interval)
         }
         
-        return self._send_request("find_apriltag", apriltag_request, timeout=30)
+        return self._send_request_hedged("find_apriltag", apriltag_request, timeout=30, hedge_delay=hedge_delay)
 
     def action_back(self):
         """反向执行上一个轨迹"""
-        print(f"\n=== 反向执行上一个轨迹 ===\n")
+        self._echo(f"\n=== 反向执行上一个轨迹 ===\n")
         
         return self._send_request("action_back", {})
 
@@ -149,12 +403,9 @@ class LabbotManagerClientBase:
             input_params: 输入参数的JSON字符串（默认为空对象）
             block_until_started: 是否阻塞直到开始执行（默认True）
         """
-        print(f"\n=== 执行机器人原语命令 ===\n")
+        self._echo(f"\n=== 执行机器人原语命令 ===\n")
         
-        try:
-            params_dict = json.loads(input_params) if isinstance(input_params, str) else (input_params if isinstance(input_params, dict) else {})
-        except json.JSONDecodeError:
-            params_dict = {}
+        params_dict = _parse_input_params(input_params) if isinstance(input_params, str) else (input_params if isinstance(input_params, dict) else {})
         
         # 构造请求参数
         execute_primitive_request = {
@@ -166,22 +417,31 @@ class LabbotManagerClientBase:
         
         return self._send_request("execute_primitive", execute_primitive_request, timeout=60)
 
-    def status(self, arm="all", remote_host: str = None):
-        """获取指定手臂的关节位置和末端执行器位姿"""
-        print(f"\n=== 获取机器人状态 ===\n")
-        print(f"手臂: {arm}")
+    def status(self, arm="all", remote_host: str = None, hedge_delay=None):
+        """获取指定手臂的关节位置和末端执行器位姿
+
+        Args:
+            arm: 手臂名称，left、right 或 all（默认all）
+            remote_host: 远程主机地址（默认None，使用本地服务）
+            hedge_delay: 对冲请求延迟（秒），超时未返回时再发一次请求（默认None，不启用）
+        """
+        self._echo(f"\n=== 获取机器人状态 ===\n")
+        self._echo(f"手臂: {arm}")
 
-        if arm not in ["left", "right", "all"]:
+        if arm not in _VALID_ARMS_ALL:
             print(f"❌ 无效的手臂名称: {arm}，必须是 'left' 或 'right' 或 'all'")
             return False
 
         if remote_host:
-            self.server_url = self.get_remote_server_url(remote_host)
+            remote_url = self.get_remote_server_url(remote_host)
+            # 地址未变化时不重新赋值，保留已缓存的接口URL
+            if remote_url != self._server_url:
+                self.server_url = remote_url
 
-        response = self._send_request("get_robot_status", {"arm": arm})
+        response = self._send_request_hedged("get_robot_status", {"arm": arm}, hedge_delay=hedge_delay)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
     
     def move_l(self, arm_name, position, orientation=[0,0,0], ref_frame="tcp", speed=0.02, acc=0.02, 
@@ -204,55 +464,30 @@ class LabbotManagerClientBase:
             python3 labbot_manager_base.py move_l right "0.0,0.0,0.04" "0,0,0" --ref_frame="world"
             python3 labbot_manager_base.py move_l left "0.0,0.0,0.04" "0,0,0" --speed=0.05 --execute=False
         """
-        print(f"\n=== 直线运动（MoveL） ===\n")
-        print(f"手臂: {arm_name}")
-        print(f"位置增量: {position}")
-        print(f"姿态增量: {orientation}")
-        print(f"参考坐标系: {ref_frame}")
-        print(f"速度: {speed}, 加速度: {acc}")
-        print(f"执行: {execute}, 等待: {wait}")
+        self._echo(f"\n=== 直线运动（MoveL） ===\n")
+        self._echo(f"手臂: {arm_name}")
+        self._echo(f"位置增量: {position}")
+        self._echo(f"姿态增量: {orientation}")
+        self._echo(f"参考坐标系: {ref_frame}")
+        self._echo(f"速度: {speed}, 加速度: {acc}")
+        self._echo(f"执行: {execute}, 等待: {wait}")
         
         # 验证手臂参数
-        if arm_name not in ["left", "right"]:
+        if arm_name not in _VALID_ARMS:
             print(f"❌ 无效的手臂名称: {arm_name}，必须是 'left' 或 'right'")
             return False
         
-        # 解析位置参数
-        try:
-            if isinstance(position, str):
-                position_list = [float(x.strip()) for x in position.split(',')]
-            elif isinstance(position, (list, tuple)):
-                position_list = [float(x) for x in position]
-            else:
-                raise ValueError(f"不支持的位置参数类型: {type(position)}")
-            
-            if len(position_list) != 3:
-                print(f"❌ 位置参数应该有3个值，但得到{len(position_list)}个")
-                return False
-        except (ValueError, TypeError):
-            print(f"Position parameter parsing error: {traceback.format_exc()}")
+        # 解析位置和姿态参数
+        position_list = self._parse_vector(position, 3, "位置")
+        if position_list is None:
             return False
-        
-        # 解析姿态参数
-        try:
-            if isinstance(orientation, str):
-                orientation_list = [float(x.strip()) for x in orientation.split(',')]
-            elif isinstance(orientation, (list, tuple)):
-                orientation_list = [float(x) for x in orientation]
-            else:
-                raise ValueError(f"不支持的姿态参数类型: {type(orientation)}")
-            
-            if len(orientation_list) != 3:
-                print(f"❌ 姿态参数应该有3个值，但得到{len(orientation_list)}个")
-                return False
-        except (ValueError, TypeError):
-            print(f"Orientation parameter parsing error: {traceback.format_exc()}")
+        orientation_list = self._parse_vector(orientation, 3, "姿态")
+        if orientation_list is None:
             return False
         
         # 验证参考坐标系
-        valid_ref_frames = ["tcp", "world"]
-        if ref_frame not in valid_ref_frames:
-            print(f"❌ 无效的参考坐标系: {ref_frame}，必须是 {valid_ref_frames} 中的一个")
+        if ref_frame not in _VALID_REF_FRAMES:
+            print(f"❌ 无效的参考坐标系: {ref_frame}，必须是 {sorted(_VALID_REF_FRAMES)} 中的一个")
             return False
         
         # 构造请求参数
@@ -272,45 +507,36 @@ class LabbotManagerClientBase:
             "wait": bool(wait)
         }
         
-        print(f"\n发送请求: {json.dumps(move_l_request, indent=2, ensure_ascii=False)}")
+        self._dump_json("发送请求", move_l_request)
         
-        try:
-            response = requests.post(
-                f"{self.server_url}/move_l",
-                json=move_l_request,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                print("\n✅ 请求成功!")
-                print(f"响应: {json.dumps(result, indent=2, ensure_ascii=False)}")
-                
-                # 显示执行结果
-                if result.get('code') == 200:  # ErrorCode.Success
-                    trajectory_path = result.get('trajectory_path', '')
-                    execution_result = result.get('execution_result', '')
-                    
-                    if trajectory_path:
-                        print(f"\n💾 轨迹文件: {trajectory_path}")
-                    
-                    if execution_result:
-                        print(f"\n🎯 执行结果: {execution_result}")
-                    
-                    print(f"\n🎉 MoveL运动完成!")
-                else:
-                    print(f"\n⚠️ MoveL运动失败: {result.get('msg', '未知错误')}")
-                
-                return True
-            else:
-                print(f"\n❌ 请求失败，状态码: {response.status_code}")
-                print(f"错误信息: {response.text}")
-                return False
-                
-        except requests.exceptions.RequestException:
-            print(f"\nRequest exception: {traceback.format_exc()}")
+        result = self._send_request("move_l", move_l_request, timeout=30)
+        if result is None:
             return False
+        self._dump_json("响应", result)
+        
+        # 显示执行结果
+        if result.get('code') == 200:  # ErrorCode.Success
+            trajectory_path = result.get('trajectory_path', '')
+            execution_result = result.get('execution_result', '')
+            
+            traj_id = result.get('traj_id')
+            if traj_id:
+                self._echo(f"\n🆔 轨迹ID: {traj_id}")
+            
+            if trajectory_path:
+                self._echo(f"\n💾 轨迹文件: {trajectory_path}")
+            
+            if execution_result:
+                self._echo(f"\n🎯 执行结果: {execution_result}")
+            
+            if result.get('msg'):
+                self._echo(f"\n📋 响应信息: {result['msg']}")
+            
+            self._echo(f"\n🎉 MoveL运动完成!")
+        else:
+            print(f"\n⚠️ MoveL运动失败: {result.get('msg', '未知错误')}")
+        
+        return True
     
     def contact(self, arm_name, contact_coord, contact_dir, speed=0.01, max_contact_force=10.0, wait=True):
         """接触操作（Contact）
@@ -327,21 +553,21 @@ class LabbotManagerClientBase:
             python3 labbot_manager_base.py contact left "0.0,0.0,0.04" "0,0,-1"
             python3 labbot_manager_base.py contact right "0.0,0.0,0.04" "0,0,-1" --speed=0.05 --max_contact_force=15.0
         """
-        print(f"\n=== 接触操作（Contact） ===\n")
-        print(f"手臂: {arm_name}")
-        print(f"接触坐标: {contact_coord}")
-        print(f"接触方向: {contact_dir}")
-        print(f"速度: {speed}, 最大接触力: {max_contact_force}")
-        print(f"等待: {wait}")
+        self._echo(f"\n=== 接触操作（Contact） ===\n")
+        self._echo(f"手臂: {arm_name}")
+        self._echo(f"接触坐标: {contact_coord}")
+        self._echo(f"接触方向: {contact_dir}")
+        self._echo(f"速度: {speed}, 最大接触力: {max_contact_force}")
+        self._echo(f"等待: {wait}")
         
         # 验证手臂参数
-        if arm_name not in ["left", "right"]:
+        if arm_name not in _VALID_ARMS:
             print(f"❌ 无效的手臂名称: {arm_name}，必须是 'left' 或 'right'")
             return False
         
         # 解析接触坐标参数
         try:
-            if not contact_coord in ["world", "tcp"]:
+            if contact_coord not in _VALID_REF_FRAMES:
                 print(f"❌ 无效的接触坐标参数: {contact_coord}，必须是 'world' 或 'tcp'")
                 return False
         except (ValueError, TypeError):
@@ -349,19 +575,8 @@ class LabbotManagerClientBase:
             return False
         
         # 解析接触方向参数
-        try:
-            if isinstance(contact_dir, str):
-                contact_dir_list = [float(x.strip()) for x in contact_dir.split(',')]
-            elif isinstance(contact_dir, (list, tuple)):
-                contact_dir_list = [float(x) for x in contact_dir]
-            else:
-                raise ValueError(f"不支持的接触方向参数类型: {type(contact_dir)}")
-            
-            if len(contact_dir_list) != 3:
-                print(f"❌ 接触方向参数应该有3个值，但得到{len(contact_dir_list)}个")
-                return False
-        except (ValueError, TypeError):
-            print(f"Direction parameter parsing error: {traceback.format_exc()}")
+        contact_dir_list = self._parse_vector(contact_dir, 3, "接触方向")
+        if contact_dir_list is None:
             return False
         
         # 构造请求参数
@@ -374,51 +589,38 @@ class LabbotManagerClientBase:
             "wait": bool(wait)
         }
         
-        print(f"\n发送请求: {json.dumps(contact_request, indent=2, ensure_ascii=False)}")
+        self._dump_json("发送请求", contact_request)
         
-        try:
-            response = requests.post(
-                f"{self.server_url}/contact",
-                json=contact_request,
-                headers={"Content-Type": "application/json"},
-                timeout=120
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                print("\n✅ 请求成功!")
-                print(f"响应: {json.dumps(result, indent=2, ensure_ascii=False)}")
-                
-                # 显示执行结果
-                if result.get('code') == 200:  # ErrorCode.Success
-                    execution_result = result.get('execution_result', '')
-                    
-                    if execution_result:
-                        print(f"\n🎯 执行结果: {execution_result}")
-                    
-                    print(f"\n🎉 Contact操作完成!")
-                else:
-                    print(f"\n⚠️ Contact操作失败: {result.get('msg', '未知错误')}")
-                
-                return True
-            else:
-                print(f"\n❌ 请求失败，状态码: {response.status_code}")
-                print(f"错误信息: {response.text}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            print(f"\n❌ 请求异常: {traceback.format_exc()}")
+        result = self._send_request("contact", contact_request, timeout=120)
+        if result is None:
             return False
+        self._dump_json("响应", result)
+        
+        # 显示执行结果
+        if result.get('code') == 200:  # ErrorCode.Success
+            execution_result = result.get('execution_result', '')
+            
+            if execution_result:
+                self._echo(f"\n🎯 执行结果: {execution_result}")
+            
+            if result.get('msg'):
+                self._echo(f"\n📋 响应信息: {result['msg']}")
+            
+            self._echo(f"\n🎉 Contact操作完成!")
+        else:
+            print(f"\n⚠️ Contact操作失败: {result.get('msg', '未知错误')}")
+        
+        return True
             
     def create_frame(self, frame_name, marker_id=0, expected_count=5, arms="left", repeat_times=1, repeat_time_interval=0.1):
         """创建坐标系"""
-        print(f"\n=== 创建坐标系 ===\n")
-        print(f"坐标系名称: {frame_name}")
-        print(f"AprilTag标记ID: {marker_id}")
-        print(f"期望观察数量: {expected_count}")
-        print(f"使用手臂: {arms}")
-        print(f"重复次数: {repeat_times}")
-        print(f"重复时间间隔: {repeat_time_interval}秒")
+        self._echo(f"\n=== 创建坐标系 ===\n")
+        self._echo(f"坐标系名称: {frame_name}")
+        self._echo(f"AprilTag标记ID: {marker_id}")
+        self._echo(f"期望观察数量: {expected_count}")
+        self._echo(f"使用手臂: {arms}")
+        self._echo(f"重复次数: {repeat_times}")
+        self._echo(f"重复时间间隔: {repeat_time_interval}秒")
 
         if isinstance(arms, list):
             arms = sorted(arms)
@@ -426,7 +628,7 @@ class LabbotManagerClientBase:
             arms = sorted(arms.split(","))
         arms = sorted(list(arms))
 
-        if len(arms) == 0 or len(set(arms) - set(["left", "right"])) > 0:
+        if len(arms) == 0 or not _VALID_ARMS.issuperset(arms):
             print(f"❌ 无效的手臂名称: {arms}，必须是 'left', 'right', 或 'left,right'")
             return False
 
@@ -455,12 +657,22 @@ class LabbotManagerClientBase:
         response = self._send_request("create_frame", create_frame_request, timeout=120)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
+    def _validate_gripper(self, label, position, speed, force):
+        """校验夹爪的位置、速度、力度均在0.0-100.0范围内，越界时逐项打印错误"""
+        values = (position, speed, force)
+        if all(0.0 <= value <= 100.0 for value in values):
+            return True
+        for name, value in zip(("位置", "速度", "力度"), values):
+            if not (0.0 <= value <= 100.0):
+                print(f"❌ 错误: {label}夹爪{name}必须在 0.0-100.0 范围内，当前值: {value}")
+        return False
+
     def gripper(self, left_position=None, left_speed=0.03, left_force=20.0,
                         right_position=None, right_speed=0.03, right_force=20.0, wait: bool=False):
         """控制左右手夹爪运动"""
-        print(f"\n=== 夹爪控制 ===\n")
+        self._echo(f"\n=== 夹爪控制 ===\n")
 
         if left_position is None and right_position is None:
             print("❌ 错误: 至少需要指定一个夹爪的位置参数")
@@ -468,57 +680,34 @@ class LabbotManagerClientBase:
 
         try:
             request_data = {}
+            grippers = (
+                ("left_gripper", "左手", left_position, left_speed, left_force),
+                ("right_gripper", "右手", right_position, right_speed, right_force),
+            )
 
-            if left_position is not None:
-                left_position = float(left_position)
-                left_speed = float(left_speed)
-                left_force = float(left_force)
-
-                if not (0.0 <= left_position <= 100.0):
-                    print(f"❌ 错误: 左手夹爪位置必须在 0.0-100.0 范围内，当前值: {left_position}")
-                    return False
-                if not (0.0 <= left_speed <= 100.0):
-                    print(f"❌ 错误: 左手夹爪速度必须在 0.0-100.0 范围内，当前值: {left_speed}")
-                    return False
-                if not (0.0 <= left_force <= 100.0):
-                    print(f"❌ 错误: 左手夹爪力度必须在 0.0-100.0 范围内，当前值: {left_force}")
-                    return False
-                
-                request_data["left_gripper"] = {
-                    "position": left_position,
-                    "speed": left_speed,
-                    "force": left_force
-                }
-                print(f"🤖 左手夹爪: 位置={left_position}, 速度={left_speed}, 力度={left_force}")
-
-            if right_position is not None:
-                right_position = float(right_position)
-                right_speed = float(right_speed)
-                right_force = float(right_force)
+            for key, label, position, speed, force in grippers:
+                if position is None:
+                    continue
+                position = float(position)
+                speed = float(speed)
+                force = float(force)
 
-                if not (0.0 <= right_position <= 100.0):
-                    print(f"❌ 错误: 右手夹爪位置必须在 0.0-100.0 范围内，当前值: {right_position}")
-                    return False
-                if not (0.0 <= right_speed <= 100.0):
-                    print(f"❌ 错误: 右手夹爪速度必须在 0.0-100.0 范围内，当前值: {right_speed}")
-                    return False
-                if not (0.0 <= right_force <= 100.0):
-                    print(f"❌ 错误: 右手夹爪力度必须在 0.0-100.0 范围内，当前值: {right_force}")
+                if not self._validate_gripper(label, position, speed, force):
                     return False
                 
-                request_data["right_gripper"] = {
-                    "position": right_position,
-                    "speed": right_speed,
-                    "force": right_force
+                request_data[key] = {
+                    "position": position,
+                    "speed": speed,
+                    "force": force
                 }
-                print(f"🤖 右手夹爪: 位置={right_position}, 速度={right_speed}, 力度={right_force}")
+                self._echo(f"🤖 {label}夹爪: 位置={position}, 速度={speed}, 力度={force}")
             
             request_data["wait"] = wait
 
             response = self._send_request("control_grippers", request_data)
 
             if response and response.get('code') == 200:
-                print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+                self._dump_json("响应", response)
             return response
         except (ValueError, TypeError):
             print(f"Gripper parameter parsing error: {traceback.format_exc()}")
@@ -527,15 +716,15 @@ class LabbotManagerClientBase:
     def move_j_to(self, arm_name, position, quaternion, ref_frame="world", speed=0.8, acc=0.8, 
                   need_traj=False, execute=True, wait=True, max_complexity_score=2.0, max_retry_attempts=3, cartesian=False,
                   keep_orientation=False, weight=100.0, tolerance=None, simultaneously_reach=False):
-        print(f"\n=== 关节空间运动到指定位姿（MoveJTo） ===\n")
-        print(f"手臂: {arm_name}")
-        print(f"目标位置: {position}")
-        print(f"目标四元数: {quaternion}")
-        print(f"参考坐标系: {ref_frame}")
-        print(f"速度: {speed}, 加速度: {acc}")
-        print(f"执行: {execute}, 等待: {wait}")
-        
-        if arm_name not in ["left", "right"]:
+        self._echo(f"\n=== 关节空间运动到指定位姿（MoveJTo） ===\n")
+        self._echo(f"手臂: {arm_name}")
+        self._echo(f"目标位置: {position}")
+        self._echo(f"目标四元数: {quaternion}")
+        self._echo(f"参考坐标系: {ref_frame}")
+        self._echo(f"速度: {speed}, 加速度: {acc}")
+        self._echo(f"执行: {execute}, 等待: {wait}")
+        
+        if arm_name not in _VALID_ARMS:
             print(f"❌ 无效的手臂名称: {arm_name}，必须是 'left' 或 'right'")
             return False
         
@@ -573,11 +762,11 @@ class LabbotManagerClientBase:
         response = self._send_request("move_j_to", move_j_to_request)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
 
     def multi_arm_move_j_to(self, arm_configs, execute=True, simultaneously_reach=False):
-        print(f"\n🤖 多手臂关节空间运动到指定位姿...")
+        self._echo(f"\n🤖 多手臂关节空间运动到指定位姿...")
         
         try:
             if isinstance(arm_configs, str):
@@ -597,7 +786,7 @@ class LabbotManagerClientBase:
             quaternion = config.get('quaternion')
             ref_frame = config.get('ref_frame', 'world')
             
-            if arm not in ["left", "right"]:
+            if arm not in _VALID_ARMS:
                 print(f"❌ 错误: 无效的手臂名称 '{arm}'，必须是 'left' 或 'right'")
                 return None
             
@@ -617,7 +806,7 @@ class LabbotManagerClientBase:
             }
             arm_requests.append(arm_request)
             
-            print(f"   手臂 {arm}: 位置={position}, 四元数={quaternion}, 参考坐标系={ref_frame}")
+            self._echo(f"   手臂 {arm}: 位置={position}, 四元数={quaternion}, 参考坐标系={ref_frame}")
         
         request_data = {
             "arm_requests": arm_requests,
@@ -628,13 +817,13 @@ class LabbotManagerClientBase:
         response = self._send_request("move_j_to", request_data)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
 
     def get_end_effector_relative_position(self, arm, frame_name):
-        print(f"\n🤖 获取 {arm} 手臂末端执行器相对于物件坐标系 '{frame_name}' 的位置和姿态...")
+        self._echo(f"\n🤖 获取 {arm} 手臂末端执行器相对于物件坐标系 '{frame_name}' 的位置和姿态...")
         
-        if arm not in ["left", "right"]:
+        if arm not in _VALID_ARMS:
             print(f"❌ 错误: 无效的手臂名称 '{arm}'，必须是 'left' 或 'right'")
             return False
         
@@ -650,16 +839,16 @@ class LabbotManagerClientBase:
         response = self._send_request("get_end_effector_relative_position", request_data)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
 
     def run_traj(self, traj_id, speed=0.5, acc=0.3, wait=True, validate_trajectory=True, remote_host: str=None):
-        print(f"\n=== 执行轨迹 ===\n")
-        print(f"轨迹ID: {traj_id}")
-        print(f"执行速度: {speed}")
-        print(f"执行加速度: {acc}")
-        print(f"等待完成: {wait}")
-        print(f"验证轨迹: {validate_trajectory}")
+        self._echo(f"\n=== 执行轨迹 ===\n")
+        self._echo(f"轨迹ID: {traj_id}")
+        self._echo(f"执行速度: {speed}")
+        self._echo(f"执行加速度: {acc}")
+        self._echo(f"等待完成: {wait}")
+        self._echo(f"验证轨迹: {validate_trajectory}")
         
         if not traj_id or not isinstance(traj_id, str):
             print(f"❌ 无效的轨迹ID: {traj_id}")
@@ -694,13 +883,13 @@ class LabbotManagerClientBase:
         response = self._send_request("run_traj", request_data)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
 
     def get_frame_offset(self, target_frame, ref_frame):
-        print(f"\n=== 获取参考系位置偏移量 ===\n")
-        print(f"目标参考系: {target_frame}")
-        print(f"参考参考系: {ref_frame}")
+        self._echo(f"\n=== 获取参考系位置偏移量 ===\n")
+        self._echo(f"目标参考系: {target_frame}")
+        self._echo(f"参考参考系: {ref_frame}")
         
         request_data = {
             "target_frame": target_frame,
@@ -710,18 +899,18 @@ class LabbotManagerClientBase:
         response = self._send_request("get_frame_offset", request_data)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
 
     def rotate_hand(self, arm_name, yaw=0.0, pitch=0.0, roll=0.0, absolute_mode=False, speed=0.8, acc=0.8, 
                     need_traj=True, wait=True, execute=True, max_complexity_score=0.1, max_retry_attempts=10):
-        print(f"\n=== 旋转手部末端执行器 ===\n")
-        print(f"手臂: {arm_name}")
-        print(f"旋转角度 - Yaw(绕x轴): {yaw}°, Pitch(绕y轴): {pitch}°, Roll(绕z轴): {roll}°")
-        print(f"速度: {speed}, 加速度: {acc}")
-        print(f"执行: {execute}, 等待: {wait}")
+        self._echo(f"\n=== 旋转手部末端执行器 ===\n")
+        self._echo(f"手臂: {arm_name}")
+        self._echo(f"旋转角度 - Yaw(绕x轴): {yaw}°, Pitch(绕y轴): {pitch}°, Roll(绕z轴): {roll}°")
+        self._echo(f"速度: {speed}, 加速度: {acc}")
+        self._echo(f"执行: {execute}, 等待: {wait}")
         
-        if arm_name not in ["left", "right"]:
+        if arm_name not in _VALID_ARMS:
             print(f"❌ 无效的手臂名称: {arm_name}，必须是 'left' 或 'right'")
             return False
         
@@ -748,9 +937,9 @@ class LabbotManagerClientBase:
         
         request_data = {
             "arm": arm_name,
-            "yaw": math.radians(yaw),
-            "pitch": math.radians(pitch),
-            "roll": math.radians(roll),
+            "yaw": yaw * _DEG2RAD,
+            "pitch": pitch * _DEG2RAD,
+            "roll": roll * _DEG2RAD,
             "absolute_mode": absolute_mode,
             "speed": speed,
             "acc": acc,
@@ -764,7 +953,7 @@ class LabbotManagerClientBase:
         response = self._send_request("rotate_hand", request_data)
 
         if response and response.get('code') == 200:
-            print(f"响应: {json.dumps(response, indent=2, ensure_ascii=False)}")
+            self._dump_json("响应", response)
         return response
 
     def multi_arm_move_j_to_new(self, arm_configs, execute=False, simultaneously_reach=True, 
@@ -790,126 +979,115 @@ class LabbotManagerClientBase:
         示例:
         python3 labbot_manager_base.py multi_arm_move_j_to_new '[{"arm":"left","position":[0.5,0.3,0.4],"quaternion":[0,0,0,1],"ref_frame":"world"},{"arm":"right","position":[0.5,-0.3,0.4],"quaternion":[0,0,0,1],"ref_frame":"world"}]' --execute=True --simultaneously_reach=True
         """
-        try:
-            print(f"\n🤖 调用新实现的多手臂关节空间运动接口...")
+        self._echo(f"\n🤖 调用新实现的多手臂关节空间运动接口...")
+        
+        # 解析arm_configs参数
+        if isinstance(arm_configs, str):
+            import json
+            try:
+                arm_configs = json.loads(arm_configs)
+            except (json.JSONDecodeError, TypeError):
+                print(f"arm_configs parameter parsing error: {traceback.format_exc()}")
+                return None
+        
+        if not isinstance(arm_configs, list) or len(arm_configs) == 0:
+            print(f"❌ 错误: arm_configs必须是非空列表")
+            return None
+        
+        # 构造arm_requests
+        arm_requests = []
+        for config in arm_configs:
+            arm = config.get('arm')
+            position = config.get('position')
+            quaternion = config.get('quaternion')
+            ref_frame = config.get('ref_frame', 'world')
+            cartesian = config.get('cartesian', False)
+            keep_orientation = config.get('keep_orientation', False)
+            weight = config.get('weight', 100.0)
+            tolerance = config.get('tolerance', None)
             
-            # 解析arm_configs参数
-            if isinstance(arm_configs, str):
-                import json
-                try:
-                    arm_configs = json.loads(arm_configs)
-                except (json.JSONDecodeError, TypeError):
-                    print(f"arm_configs parameter parsing error: {traceback.format_exc()}")
-                    return None
+            # 验证参数
+            if arm not in _VALID_ARMS:
+                print(f"❌ 错误: 无效的手臂名称 '{arm}'，必须是 'left' 或 'right'")
+                return None
             
-            if not isinstance(arm_configs, list) or len(arm_configs) == 0:
-                print(f"❌ 错误: arm_configs必须是非空列表")
+            if not position or len(position) != 3:
+                print(f"❌ 错误: 手臂 {arm} 的位置必须是3个数值的列表")
                 return None
             
-            # 构造arm_requests
-            arm_requests = []
-            for config in arm_configs:
-                arm = config.get('arm')
-                position = config.get('position')
-                quaternion = config.get('quaternion')
-                ref_frame = config.get('ref_frame', 'world')
-                cartesian = config.get('cartesian', False)
-                keep_orientation = config.get('keep_orientation', False)
-                weight = config.get('weight', 100.0)
-                tolerance = config.get('tolerance', None)
-                
-                # 验证参数
-                if arm not in ["left", "right"]:
-                    print(f"❌ 错误: 无效的手臂名称 '{arm}'，必须是 'left' 或 'right'")
-                    return None
-                
-                if not position or len(position) != 3:
-                    print(f"❌ 错误: 手臂 {arm} 的位置必须是3个数值的列表")
-                    return None
-                
-                if not quaternion or len(quaternion) != 4:
-                    print(f"❌ 错误: 手臂 {arm} 的四元数必须是4个数值的列表")
-                    return None
-                
-                arm_request = {
-                    "arm": arm,
-                    "position": position,
-                    "quaternion": quaternion,
-                    "ref_frame": ref_frame,
-                    "cartesian": cartesian,
-                    "keep_orientation": keep_orientation,
-                    "weight": weight,
-                    "tolerance": tolerance
-                }
-                arm_requests.append(arm_request)
-                
-                print(f"   手臂 {arm}: 位置={position}, 四元数={quaternion}, 参考坐标系={ref_frame}")
-                print(f"     笛卡尔={cartesian}, 保持朝向={keep_orientation}, 权重={weight}")
+            if not quaternion or len(quaternion) != 4:
+                print(f"❌ 错误: 手臂 {arm} 的四元数必须是4个数值的列表")
+                return None
             
-            # 构造请求数据
-            request_data = {
-                "arm_requests": arm_requests,
-                "execute": execute,
-                "simultaneously_reach": simultaneously_reach,
-                "max_complexity_score": max_complexity_score,
-                "max_retry_attempts": max_retry_attempts
+            arm_request = {
+                "arm": arm,
+                "position": position,
+                "quaternion": quaternion,
+                "ref_frame": ref_frame,
+                "cartesian": cartesian,
+                "keep_orientation": keep_orientation,
+                "weight": weight,
+                "tolerance": tolerance
             }
+            arm_requests.append(arm_request)
             
-            print(f"\n📤 发送请求到新接口: {json.dumps(request_data, indent=2, ensure_ascii=False)}")
+            self._echo(f"   手臂 {arm}: 位置={position}, 四元数={quaternion}, 参考坐标系={ref_frame}")
+            self._echo(f"     笛卡尔={cartesian}, 保持朝向={keep_orientation}, 权重={weight}")
+        
+        # 构造请求数据
+        request_data = {
+            "arm_requests": arm_requests,
+            "execute": execute,
+            "simultaneously_reach": simultaneously_reach,
+            "max_complexity_score": max_complexity_score,
+            "max_retry_attempts": max_retry_attempts
+        }
+        
+        self._dump_json("发送请求到新接口", request_data)
+        
+        result = self._send_request("multi_arm_move_j_to", request_data, timeout=30)
+        if result is None:
+            return None
+        self._dump_json("收到响应", result)
+        
+        if result.get('code') == 200:
+            self._echo(f"\n✅ 新接口多手臂关节空间运动成功!")
+            self._echo(f"   消息: {result.get('msg', '')}")
+            self._echo(f"   整体规划成功: {result.get('overall_planned', False)}")
+            self._echo(f"   整体执行成功: {result.get('overall_executed', False)}")
             
-            # 发送POST请求到新的接口
-            response = requests.post(f"{SERVER_URL}/multi_arm_move_j_to", json=request_data, timeout=30)
+            # 显示各手臂结果
+            arm_results = result.get('arm_results', [])
+            if arm_results:
+                for arm_result in arm_results:
+                    self._echo(f"   手臂 {arm_result.get('arm', 'N/A')}:")
+                    self._echo(f"     规划成功: {arm_result.get('planned', False)}")
+                    self._echo(f"     执行成功: {arm_result.get('executed', False)}")
+                    if arm_result.get('final_position'):
+                        self._echo(f"     最终位置: {arm_result.get('final_position', [])}")
+                    if arm_result.get('final_quaternion'):
+                        self._echo(f"     最终姿态: {arm_result.get('final_quaternion', [])}")
             
-            if response.status_code == 200:
-                result = response.json()
-                print(f"\n收到响应: {json.dumps(result, indent=2, ensure_ascii=False)}")
-                
-                if result.get('code') == 200:
-                    print(f"\n✅ 新接口多手臂关节空间运动成功!")
-                    print(f"   消息: {result.get('msg', '')}")
-                    print(f"   整体规划成功: {result.get('overall_planned', False)}")
-                    print(f"   整体执行成功: {result.get('overall_executed', False)}")
-                    
-                    # 显示各手臂结果
-                    arm_results = result.get('arm_results', [])
-                    if arm_results:
-                        for arm_result in arm_results:
-                            print(f"   手臂 {arm_result.get('arm', 'N/A')}:")
-                            print(f"     规划成功: {arm_result.get('planned', False)}")
-                            print(f"     执行成功: {arm_result.get('executed', False)}")
-                            if arm_result.get('final_position'):
-                                print(f"     最终位置: {arm_result.get('final_position', [])}")
-                            if arm_result.get('final_quaternion'):
-                                print(f"     最终姿态: {arm_result.get('final_quaternion', [])}")
-                    
-                    # 显示轨迹ID
-                    if result.get('traj_id'):
-                        print(f"   轨迹ID: {result.get('traj_id')}")
-                    
-                    return result
-                else:
-                    print(f"\n⚠️ 新接口多手臂关节空间运动失败: {result.get('msg', '未知错误')}")
-                    print(f"   错误码: {result.get('code', 'N/A')}")
-                    print(f"   整体规划成功: {result.get('overall_planned', False)}")
-                    print(f"   整体执行成功: {result.get('overall_executed', False)}")
-                    
-                    # 显示各手臂结果
-                    arm_results = result.get('arm_results', [])
-                    if arm_results:
-                        for arm_result in arm_results:
-                            print(f"   手臂 {arm_result.get('arm', 'N/A')}:")
-                            print(f"     规划成功: {arm_result.get('planned', False)}")
-                            print(f"     执行成功: {arm_result.get('executed', False)}")
-                    
-                    return result
-            else:
-                print(f"\n❌ HTTP错误: {response.status_code}")
-                print(f"响应内容: {response.text}")
-                return None
-                
-        except requests.exceptions.RequestException:
-            print(f"\nRequest exception: {traceback.format_exc()}")
-            return None
+            # 显示轨迹ID
+            if result.get('traj_id'):
+                self._echo(f"   轨迹ID: {result.get('traj_id')}")
+            
+            return result
+        else:
+            print(f"\n⚠️ 新接口多手臂关节空间运动失败: {result.get('msg', '未知错误')}")
+            print(f"   错误码: {result.get('code', 'N/A')}")
+            print(f"   整体规划成功: {result.get('overall_planned', False)}")
+            print(f"   整体执行成功: {result.get('overall_executed', False)}")
+            
+            # 显示各手臂结果
+            arm_results = result.get('arm_results', [])
+            if arm_results:
+                for arm_result in arm_results:
+                    print(f"   手臂 {arm_result.get('arm', 'N/A')}:")
+                    print(f"     规划成功: {arm_result.get('planned', False)}")
+                    print(f"     执行成功: {arm_result.get('executed', False)}")
+            
+            return result
 
     def move_j_to_traj_start(self, traj_id, speed=1.0, acc=1.0, wait=True, execute:bool=True):
         """Moves to the starting point of a specified trajectory."""
@@ -975,16 +1153,14 @@ class LabbotManagerClientBase:
             current_position = list(right_start_position)
             current_quaternion = list(right_start_quaternion)
         else:
-            print(f"\nGetting right arm status...")
+            self._echo(f"\nGetting right arm status...")
             joint_states_request = {"arm": "right"}
             result = self._send_request("get_robot_status", joint_states_request, timeout=30)
             if not result or result.get('code') != 200:
                 print(f"Failed to get current status: {result.get('msg', 'Unknown error') if result else 'No response'}")
                 return False
 
-            right_arm_data = result.get('right_arm', {})
-            right_robot_tf = right_arm_data.get('robot_tf', {})
-            right_tcp_robot = right_robot_tf.get('tcp', {})
+            right_tcp_robot = _dig(result, 'right_arm', 'robot_tf', 'tcp', default={})
             current_position = right_tcp_robot.get('position', [])
             current_quaternion = right_tcp_robot.get('orientation', [])
             current_joint_positions = result.get('joint_states', [])
@@ -1001,17 +1177,15 @@ class LabbotManagerClientBase:
                 if len(offset_part) < 3:
                     print(f"Offset command format error: {offset_part}")
                     return False
-                axis = offset_part[0].lower()
-                value_str = offset_part[1:]
-                if axis not in ['x', 'y', 'z']:
-                    print(f"Invalid axis name: {axis}, must be 'x', 'y' or 'z'")
+                axis_index = _AXIS_INDEX.get(offset_part[0])
+                if axis_index is None:
+                    print(f"Invalid axis name: {offset_part[0]}, must be 'x', 'y' or 'z'")
                     return False
                 try:
-                    offset_value = float(value_str)
+                    offset_value = float(offset_part[1:])
                 except ValueError:
                     print(f"Invalid offset value: {traceback.format_exc()}")
                     return False
-                axis_index = {'x': 0, 'y': 1, 'z': 2}[axis]
                 target_position[axis_index] += offset_value
         except Exception:
             print(f"Offset command parsing error: {traceback.format_exc()}")
@@ -1055,8 +1229,16 @@ class LabbotManagerClientBase:
                 self.run_traj(remote_traj_id, remote_host=remote_host)
         return remote_result
 
+def _configure_logging():
+    """按环境变量LABBOT_LOG_LEVEL配置日志级别，大小写均可，无法识别时使用INFO"""
+    level = logging.getLevelName(os.environ.get("LABBOT_LOG_LEVEL", "INFO").upper())
+    logging.basicConfig(level=level if isinstance(level, int) else logging.INFO)
+
 def main():
+    import fire
+
     os.environ['PAGER'] = 'cat'
+    _configure_logging()
     try:
         fire.Fire(LabbotManagerClientBase)
     except Exception:
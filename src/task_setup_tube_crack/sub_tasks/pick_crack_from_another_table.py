@@ -14,15 +14,15 @@
 """
 
 import os
+import shutil
 import time
 import numpy as np
-import json
 from copy import deepcopy
 from loguru import logger
 import const as Const
 
 from src.client.aico2 import LabbotManagerClient
-from src.util.util import reverse_trajectory_file, safe_get_tf_shift, safe_move_j, safe_plan_fast_move_j_to_dual_arm
+from src.util.util import load_trajectory_file, reverse_trajectory_file, safe_get_tf_shift, safe_move_j, safe_plan_fast_move_j_to_dual_arm
 
 def pick_crack_from_another_table(crack_config: dict):
     """
@@ -86,7 +86,7 @@ def pick_crack_from_another_table(crack_config: dict):
     )
     if isinstance(dual_arm_plan_result, dict) and dual_arm_plan_result["code"] == 200:
         traj_id = dual_arm_plan_result["traj_id"]
-        os.system(f"cp {os.path.join(Const.TRAJ_HOME, traj_id)} {os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_traj_1.json')}")
+        shutil.copyfile(os.path.join(Const.TRAJ_HOME, traj_id), os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_traj_1.json'))
         reverse_trajectory_file(
             os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_1.json"),
             os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_1_reversed.json")
@@ -96,10 +96,9 @@ def pick_crack_from_another_table(crack_config: dict):
         print(f"=> Fast Move J To Dual Arm failed! Abort!!!")
         return False
     # 获取反向轨迹的第一个joint_states
-    with open(os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_1_reversed.json"), "r") as f:
-        data = json.load(f)
-        last_joint_states = data["points"][0]["positions"]
-        logger.info(f"last_joint_states: {last_joint_states}")
+    data = load_trajectory_file(os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_1_reversed.json"))
+    last_joint_states = data["points"][0]["positions"]
+    logger.info(f"last_joint_states: {last_joint_states}")
     # 得到这个点的右手tcp位置
     new_right_start_tcp_position = traj_right_start_position + np.array(CRACK_BASE_SHIFT)
     logger.info(f"new_right_start_tcp_position: {new_right_start_tcp_position}")
@@ -114,7 +113,7 @@ def pick_crack_from_another_table(crack_config: dict):
     )
     if isinstance(dual_arm_plan_result, dict) and dual_arm_plan_result["code"] == 200:
         traj_id = dual_arm_plan_result["traj_id"]
-        os.system(f"cp {os.path.join(Const.TRAJ_HOME, traj_id)} {os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_traj_2.json')}")
+        shutil.copyfile(os.path.join(Const.TRAJ_HOME, traj_id), os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_traj_2.json'))
         reverse_trajectory_file(
             os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_2.json"),
             os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_2_reversed.json")
@@ -124,17 +123,16 @@ def pick_crack_from_another_table(crack_config: dict):
         print(f"=> Fast Move J To Dual Arm failed! Abort!!!")
         return False
     # 获取反向轨迹的第一个joint_states，这就是接下来双手需要move_j到达的joint_states
-    with open(os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_2_reversed.json"), "r") as f:
-        data = json.load(f)
-        target_joint_states = data["points"][0]["positions"]
-        logger.info(f"target_joint_states: {target_joint_states}")
+    data = load_trajectory_file(os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_traj_2_reversed.json"))
+    target_joint_states = data["points"][0]["positions"]
+    logger.info(f"target_joint_states: {target_joint_states}")
     
     # 开始move_j !!!!!!!!!!!
     result = safe_move_j(client, target_joint_states, traj_point_limit=50)
     if isinstance(result, dict) and result["code"] == 200:
         logger.info(f"move_j success: {result}")
         traj_id = result["traj_id"][0]
-        os.system(f"cp {os.path.join(Const.TRAJ_HOME, traj_id)} {os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_pick_traj.json')}")
+        shutil.copyfile(os.path.join(Const.TRAJ_HOME, traj_id), os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_pick_traj.json'))
         reverse_trajectory_file(
             os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_pick_traj.json"),
             os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_pick_traj_reversed.json")
@@ -5,6 +5,7 @@ import time
 import numpy as np
 from copy import deepcopy
 from loguru import logger
+import const as Const
 
 from src.client.aico2 import LabbotManagerClient
 from src.util.util import safe_get_tf_shift, safe_fast_move_j_to
@@ -67,6 +68,7 @@ def pull_out_crack(column_machine_config: dict, crack_config: dict):
         arm_name="right",
         offset_commands=f"x{target_position[0]:.4f},y{target_position[1]:.4f},z{target_position[2]:.4f}",
         traj_point_limit=40,
+        traj_home=Const.TRAJ_HOME,
     )
     if result is None or result["code"] != 200:
         print(f"=> Execute Traj failed! Abort!!!")
@@ -83,6 +85,7 @@ def pull_out_crack(column_machine_config: dict, crack_config: dict):
         arm_name="right",
         offset_commands=f"z+0.003",
         traj_point_limit=6,
+        traj_home=Const.TRAJ_HOME,
     )
     if result is None or result["code"] != 200:
         print(f"=> Execute Traj failed! Abort!!!")
@@ -121,6 +124,7 @@ def pull_out_crack(column_machine_config: dict, crack_config: dict):
         arm_name="right",
         offset_commands=f"x-0.05",
         traj_point_limit=60,
+        traj_home=Const.TRAJ_HOME,
     )
     if result is None or result["code"] != 200:
         print(f"=> Execute Traj failed! Abort!!!")
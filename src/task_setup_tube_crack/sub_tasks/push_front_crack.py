@@ -19,6 +19,7 @@ import time
 import numpy as np
 from copy import deepcopy
 from loguru import logger
+import const as Const
 
 from src.client.aico2 import LabbotManagerClient
 from src.util.util import safe_get_tf_shift, safe_fast_move_j_to
@@ -71,6 +72,7 @@ def push_front_crack(crack_config: dict):
         arm_name="right",
         offset_commands=f"x{target_position[0]:.4f},y{target_position[1]:.4f},z{target_position[2]:.4f}",
         traj_point_limit=26,
+        traj_home=Const.TRAJ_HOME,
     )
     if result is None or result["code"] != 200:
         print(f"=> Fast Move J To failed! Abort!!!")
@@ -88,6 +90,7 @@ def push_front_crack(crack_config: dict):
         arm_name="right",
         offset_commands=f"z+0.003",
         traj_point_limit=6,
+        traj_home=Const.TRAJ_HOME,
     )
     if result is None or result["code"] != 200:
         print(f"=> Fast Move J To failed! Abort!!!")
@@ -15,14 +15,14 @@ setup_front_crack.py - 试管架前端安装任务
 """
 
 import os
+import shutil
 import time
 import numpy as np
-import json
 from loguru import logger
 import const as Const
 
 from src.client.aico2 import LabbotManagerClient
-from src.util.util import safe_get_tf_shift, safe_plan_fast_move_j_to_dual_arm
+from src.util.util import load_trajectory_file, safe_get_tf_shift, safe_plan_fast_move_j_to_dual_arm
 
 def setup_front_crack(crack_config: dict, column_machine_config: dict):
     """
@@ -88,16 +88,15 @@ def setup_front_crack(crack_config: dict, column_machine_config: dict):
     )
     if isinstance(dual_arm_plan_result, dict) and dual_arm_plan_result["code"] == 200:
         traj_id = dual_arm_plan_result["traj_id"]
-        os.system(f"cp {os.path.join(Const.TRAJ_HOME, traj_id)} {os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_setup_front_crack_traj_1.json')}")
+        shutil.copyfile(os.path.join(Const.TRAJ_HOME, traj_id), os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_setup_front_crack_traj_1.json'))
         logger.info(f"reverse_trajectory_file: {traj_id}")
     else:
         print(f"=> Fast Move J To Dual Arm failed! Abort!!!")
         return False
     # 获取轨迹的最后一个joint_states
-    with open(os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_setup_front_crack_traj_1.json"), "r") as f:
-        data = json.load(f)
-        last_joint_states = data["points"][-1]["positions"]
-        logger.info(f"last_joint_states: {last_joint_states}")
+    data = load_trajectory_file(os.path.join(Const.TRAJ_HOME, "tmp_dual_arm_setup_front_crack_traj_1.json"))
+    last_joint_states = data["points"][-1]["positions"]
+    logger.info(f"last_joint_states: {last_joint_states}")
     # 得到这个点的右手tcp位置
     new_right_start_tcp_position = traj_right_start_position + np.array(CRACK_BASE_SHIFT)
     logger.info(f"new_right_start_tcp_position: {new_right_start_tcp_position}")
@@ -112,7 +111,7 @@ def setup_front_crack(crack_config: dict, column_machine_config: dict):
     )
     if isinstance(dual_arm_plan_result, dict) and dual_arm_plan_result["code"] == 200:
         traj_id = dual_arm_plan_result["traj_id"]
-        os.system(f"cp {os.path.join(Const.TRAJ_HOME, traj_id)} {os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_setup_front_crack_traj_2.json')}")
+        shutil.copyfile(os.path.join(Const.TRAJ_HOME, traj_id), os.path.join(Const.TRAJ_HOME, 'tmp_dual_arm_setup_front_crack_traj_2.json'))
         logger.info(f"reverse_trajectory_file: {traj_id}")
     else:
         print(f"=> Fast Move J To Dual Arm failed! Abort!!!")
@@ -15,6 +15,11 @@ import numpy as np
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 轨迹文件存储目录（需要根据实际配置设置）
 TRAJ_HOME = "/path/to/trajectory/home"  # 轨迹文件存储目录路径
 
@@ -26,6 +31,14 @@ def reverse_trajectory_file(*args, **kwargs):
     """无具体实现, 仅做示意"""
     return True
 
+def load_trajectory_file(path):
+    """读取轨迹文件，优先使用orjson解析"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 def safe_get_tf_shift(client: LabbotManagerClient, config: dict, retry_times: int = 3, wait_before_start: float = 1.5, build_origin_tf: bool = False):
     """
     安全获取坐标系偏移量
@@ -97,7 +110,7 @@ def safe_get_tf_shift(client: LabbotManagerClient, config: dict, retry_times: in
     return None
 
 
-def safe_fast_move_j_to(client, arm_name, offset_commands, traj_point_limit: int, max_retry_times: int=5):
+def safe_fast_move_j_to(client, arm_name, offset_commands, traj_point_limit: int, traj_home: str, max_retry_times: int=5):
     """
     安全快速关节空间移动（带轨迹长度检查）
     
@@ -109,6 +122,7 @@ def safe_fast_move_j_to(client, arm_name, offset_commands, traj_point_limit: int
         arm_name: 机械臂名称（"left"或"right"）
         offset_commands: 偏移命令字符串，格式为"x,y,z,rx,ry,rz"
         traj_point_limit: 轨迹点数量限制，超过此值将重新规划
+        traj_home: 轨迹文件存储目录（如Const.TRAJ_HOME）
         max_retry_times: 最大重试次数，默认5次
     
     Returns:
@@ -130,8 +144,7 @@ def safe_fast_move_j_to(client, arm_name, offset_commands, traj_point_limit: int
         traj_id = result["traj_id"]
         logger.info(f"traj_id: {traj_id}")
         # 检查轨迹点数量是否超过预期
-        with open(os.path.join(Const.TRAJ_HOME, traj_id), 'r') as f:
-            traj_data = json.load(f)
+        traj_data = load_trajectory_file(os.path.join(traj_home, traj_id))
         traj_length = len(traj_data["points"])
         logger.info(f"traj_length: {traj_length}")
         if traj_length > traj_point_limit:
@@ -186,8 +199,7 @@ def safe_move_j(client, target_joint_states, traj_point_limit: int, max_retry_ti
         # 检查轨迹点数量是否超过预期
         if isinstance(traj_id, list):
             traj_id = traj_id[0]
-        with open(os.path.join(TRAJ_HOME, traj_id), 'r') as f:
-            traj_data = json.load(f)
+        traj_data = load_trajectory_file(os.path.join(TRAJ_HOME, traj_id))
         traj_length = len(traj_data["points"])
         logger.info(f"traj_length: {traj_length}")
         if traj_length > traj_point_limit: